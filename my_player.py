@@ -1,8 +1,115 @@
+import math
+import random
+import time
+import weakref
+from collections.abc import Sequence
+
+import numpy as np
+from numba import njit, prange
 from player_hex import PlayerHex
 from seahorse.game.action import Action
 from seahorse.game.game_state import GameState
+from seahorse.game.light_action import LightAction
 from game_state_hex import GameStateHex
-from seahorse.utils.custom_exceptions import MethodNotImplementedError
+
+# Value of a won position, large enough to dominate any heuristic evaluation
+WIN_SCORE = 1000.0
+
+# Kind of value stored in the transposition table
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+# Maximum number of positions kept in the transposition table
+TRANSPOSITION_TABLE_SIZE = 500_000
+
+# Offsets of the six neighbours of a cell, in the order of BoardHex.get_neighbours
+HEX_NEIGHBOUR_OFFSETS = ((-1, 1), (-1, 0), (1, -1), (1, 0), (0, -1), (0, 1))
+
+
+@njit(cache=True)
+def _dijkstra_hex(board: np.ndarray, piece_code: int, neighbours: np.ndarray) -> int:
+    """
+    Number of empty cells to fill for piece_code to connect the first and last rows of board.
+
+    Own pieces cost 0, empty cells 1 and the other pieces cannot be crossed. With only these two costs
+    Dijkstra reduces to a 0-1 BFS: cells reached at no cost go to the front of a deque, the others to
+    the back, so that the deque stays sorted by distance. The deque is a ring buffer of cell indices.
+
+    Args:
+        board (np.ndarray): int8 array of shape (dim, dim), 0 for empty cells.
+        piece_code (int): Value of the pieces of the player in board.
+        neighbours (np.ndarray): Neighbour table of the board dimension, see MyPlayer._neighbour_table.
+
+    Returns:
+        int: Length of the shortest connection, dim * dim if there is none.
+    """
+    dim = board.shape[0]
+    n = dim * dim
+    capacity = 7 * n
+    dist = np.full(n, n, dtype=np.int64)
+    visited = np.zeros(n, dtype=np.bool_)
+    queue = np.empty(capacity, dtype=np.int64)
+    head = 0
+    tail = 0
+    for j in range(dim):
+        code = board[0, j]
+        if code == piece_code:
+            dist[j] = 0
+            head = (head - 1) % capacity
+            queue[head] = j
+        elif code == 0:
+            dist[j] = 1
+            queue[tail] = j
+            tail = (tail + 1) % capacity
+
+    while head != tail:
+        cell = queue[head]
+        head = (head + 1) % capacity
+        if visited[cell]:
+            continue
+        visited[cell] = True
+        i = cell // dim
+        j = cell % dim
+        d = dist[cell]
+        if i == dim - 1:
+            return d
+        for k in range(6):
+            ni = neighbours[i, j, k, 0]
+            if ni < 0:
+                continue
+            nj = neighbours[i, j, k, 1]
+            code = board[ni, nj]
+            ncell = ni * dim + nj
+            if code == piece_code:
+                if d < dist[ncell]:
+                    dist[ncell] = d
+                    head = (head - 1) % capacity
+                    queue[head] = ncell
+            elif code == 0:
+                if d + 1 < dist[ncell]:
+                    dist[ncell] = d + 1
+                    queue[tail] = ncell
+                    tail = (tail + 1) % capacity
+    return n
+
+
+@njit(cache=True, parallel=True)
+def _batch_dijkstra(boards: np.ndarray, piece_code: int, neighbours: np.ndarray) -> np.ndarray:
+    """
+    _dijkstra_hex on a stack of boards of the same dimension, solved in parallel.
+
+    Args:
+        boards (np.ndarray): int8 array of shape (N, dim, dim).
+        piece_code (int): Value of the pieces of the player in the boards.
+        neighbours (np.ndarray): Neighbour table of the board dimension.
+
+    Returns:
+        np.ndarray: int32 array of the N shortest connection lengths.
+    """
+    result = np.empty(boards.shape[0], dtype=np.int32)
+    for b in prange(boards.shape[0]):
+        result[b] = _dijkstra_hex(boards[b], piece_code, neighbours)
+    return result
+
 
 class MyPlayer(PlayerHex):
     """
@@ -10,28 +117,582 @@ class MyPlayer(PlayerHex):
 
     Attributes:
         piece_type (str): piece type of the player "R" for the first player and "B" for the second player
+        max_depth (int | None): deepest iteration of the iterative deepening, None to only stop on time
     """
 
-    def __init__(self, piece_type: str, name: str = "MyPlayer"):
+    def __init__(self, piece_type: str, name: str = "MyPlayer", max_depth: int | None = None):
         """
         Initialize the PlayerHex instance.
 
         Args:
             piece_type (str): Type of the player's game piece
             name (str, optional): Name of the player (default is "bob")
+            max_depth (int | None, optional): Deepest search horizon (default is None, limited by time only)
         """
         super().__init__(piece_type, name)
+        self.max_depth = max_depth
+        # Horizon of the current iteration and time at which the search must stop
+        self._horizon = 0
+        self._deadline = math.inf
+        # Zobrist keys of each piece type indexed by bit position i * dim + j, filled for each new board dimension
+        self._zobrist = {}
+        self._zobrist_dim = None
+        # Heuristic lookup tables indexed by board dimension, see _get_luts
+        self._lut_cache = {}
+        # Neighbour tables indexed by board dimension
+        self._neighbours = {}
+        # Transposition table: hash -> (value, remaining depth, EXACT/LOWER_BOUND/UPPER_BOUND, best cell
+        # i * dim + j or None, number of pieces), win and loss distances of the values being counted from
+        # the state, see _value_to_tt
+        self._tt = {}
+        # Hashes of the states built by _next: id(state) -> (weak reference to state, hash)
+        self._state_hash = {}
+        # Piece type the values of _tt are signed for
+        self._tt_piece_type = piece_type
 
     def compute_action(self, current_state: GameState, remaining_time: int = 1e9, **kwargs) -> Action:
         """
         Use the minimax algorithm to choose the best action based on the heuristic evaluation of game states.
 
+        The search is iteratively deepened until the time budget of the move is spent, each iteration
+        trying first the root actions that scored best in the previous one. The first iteration is
+        ordered by the accurate heuristic, which already ranks the root actions as a depth 1 search
+        mostly would, so the deepening starts at depth 2.
+
         Args:
             current_state (GameState): The current game state.
+            remaining_time (int): Time left for the rest of the game in seconds.
 
         Returns:
             Action: The best action as determined by minimax.
         """
+        self._deadline = time.time() + self.compute_per_move_budget(current_state, remaining_time)
+        self._state_hash.clear()
+        if self._tt_piece_type != self.piece_type:
+            # copy_player_with_new_piece_type shares the table of the player of the other colour, whose
+            # values are of the opposite sign: start a new one instead of clearing the shared one
+            self._tt = {}
+            self._tt_piece_type = self.piece_type
+        else:
+            # The states searched from now on all have more pieces than the current one
+            n_pieces = len(current_state.get_rep().get_env())
+            self._tt = {key: entry for key, entry in self._tt.items() if entry[4] > n_pieces}
+        actions = self.ordered_root_actions(current_state)
+        best_action = actions[0]
+        max_depth = len(actions) if self.max_depth is None else min(self.max_depth, len(actions))
+        for depth in range(min(2, max_depth), max_depth + 1):
+            try:
+                scores = self.search_root(current_state, actions, depth)
+            except TimeoutError:
+                break
+            # Stable sort: actions with equal scores keep the order of the previous iteration
+            actions = [actions[k] for k in np.argsort(-scores, kind="stable")]
+            best_action = actions[0]
+            if scores.max() >= WIN_SCORE - depth:
+                break
+        return best_action
+
+    def compute_per_move_budget(self, state: GameStateHex, remaining_time: float) -> float:
+        """
+        Share of the remaining time allocated to the current move.
+
+        Args:
+            state (GameStateHex): The current game state.
+            remaining_time (float): Time left for the rest of the game in seconds.
+
+        Returns:
+            float: Time in seconds the search may use for this move.
+        """
+        dim = state.get_rep().get_dimensions()[0]
+        empty_cells = dim * dim - len(state.get_rep().get_env())
+        return remaining_time / max(1, empty_cells // 2)
+
+    def search_root(self, state: GameStateHex, actions: list[Action], horizon: int) -> np.ndarray:
+        """
+        Run one iteration of the alpha-beta search from the root.
+
+        Args:
+            state (GameStateHex): The root state, where we are to play.
+            actions (list[Action]): The root actions, in the order they are searched.
+            horizon (int): Depth at which the heuristic replaces the search.
+
+        Returns:
+            np.ndarray: float64 array of the minimax value of each root action, in the order of actions
+                (an upper bound for the pruned ones).
+
+        Raises:
+            TimeoutError: If the deadline of the move is reached during the search.
+        """
+        self._horizon = horizon
+        scores = np.empty(len(actions), dtype=np.float64)
+        alpha = -math.inf
+        for k, action in enumerate(actions):
+            scores[k] = self.minimax(self._next(state, action), alpha, math.inf, False, 1)
+            alpha = max(alpha, scores[k])
+        return scores
+
+    def minimax(self, state: GameStateHex, alpha: float = -math.inf, beta: float = math.inf,
+                maximizing_player: bool = True, depth: int = 0) -> float:
+        """
+        Evaluate a state with the minimax algorithm and alpha-beta pruning.
+
+        Args:
+            state (GameStateHex): The state to evaluate.
+            alpha (float): Best value already guaranteed to the maximizing player.
+            beta (float): Best value already guaranteed to the minimizing player.
+            maximizing_player (bool): True if it is our turn to play in state.
+            depth (int): Number of plies already played from the root.
+
+        Returns:
+            float: The minimax value of the state.
+
+        Raises:
+            TimeoutError: If the deadline of the move is reached.
+        """
+        if time.time() > self._deadline:
+            raise TimeoutError()
+        if state.is_done():
+            return self.terminal_value(state, depth)
+        if depth >= self._horizon:
+            return self.heuristic(state)
+
+        depth_remaining = self._horizon - depth
+        key = self._hash_state(state)
+        entry = self._tt.get(key)
+        pv_cell = None
+        if entry is not None:
+            value, stored_depth, flag, pv_cell, _ = entry
+            value = self._value_from_tt(value, depth)
+            if stored_depth >= depth_remaining:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER_BOUND:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+        alpha_orig, beta_orig = alpha, beta
+
+        if depth_remaining == 1:
+            frontier = self._best_child_heuristic(state, maximizing_player, depth)
+            if frontier is not None:
+                best_value, best_action = frontier
+                self._store_tt(state, best_value, depth, EXACT, best_action)
+                return best_value
+
+        actions = list(state.get_possible_light_actions())
+        if pv_cell is not None:
+            piece_type = self.piece_type if maximizing_player else self._opponent_piece_type()
+            pv_action = LightAction({"piece": piece_type, "position": divmod(pv_cell, self._zobrist_dim)})
+            if pv_action in actions:
+                actions.remove(pv_action)
+                actions.insert(0, pv_action)
+
+        best_action = None
+        if maximizing_player:
+            best_value = -math.inf
+            for action in actions:
+                value = self.minimax(self._next(state, action), alpha, beta, False, depth + 1)
+                if value > best_value:
+                    best_value, best_action = value, action
+                alpha = max(alpha, best_value)
+                if alpha >= beta:
+                    break
+        else:
+            best_value = math.inf
+            for action in actions:
+                value = self.minimax(self._next(state, action), alpha, beta, True, depth + 1)
+                if value < best_value:
+                    best_value, best_action = value, action
+                beta = min(beta, best_value)
+                if alpha >= beta:
+                    break
+
+        if best_value <= alpha_orig:
+            flag = UPPER_BOUND
+        elif best_value >= beta_orig:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._store_tt(state, best_value, depth, flag, best_action)
+        return best_value
+
+    def _store_tt(self, state: GameStateHex, value: float, depth: int, flag: int, action: Action | None) -> None:
+        """
+        Store the result of a search in the transposition table, dropping the oldest entry when it is full.
+
+        The best action is kept as its cell index rather than as a LightAction, the table being kept
+        across moves.
+
+        Args:
+            state (GameStateHex): The searched state.
+            value (float): Value found for the state.
+            depth (int): Number of plies from the root to the state.
+            flag (int): EXACT, LOWER_BOUND or UPPER_BOUND.
+            action (Action | None): Best action found in the state.
+        """
+        key = self._hash_state(state)
+        if key not in self._tt and len(self._tt) >= TRANSPOSITION_TABLE_SIZE:
+            del self._tt[next(iter(self._tt))]
+        cell = None
+        if action is not None:
+            i, j = action.data["position"]
+            cell = i * self._zobrist_dim + j
+        n_pieces = len(state.get_rep().get_env())
+        self._tt[key] = (self._value_to_tt(value, depth), self._horizon - depth, flag, cell, n_pieces)
+
+    @staticmethod
+    def _value_to_tt(value: float, depth: int) -> float:
+        """
+        Value as stored in the transposition table, win and loss distances counted from the state.
+
+        The root of a later move is deeper in the game, so a distance counted from the root of the move
+        that stored the value would be off once the entry is read again.
+
+        Args:
+            value (float): Value of a state, win and loss distances counted from the root.
+            depth (int): Number of plies from the root to the state.
+
+        Returns:
+            float: The value with win and loss distances counted from the state.
+        """
+        if value > WIN_SCORE / 2:
+            return value + depth
+        if value < -WIN_SCORE / 2:
+            return value - depth
+        return value
+
+    @staticmethod
+    def _value_from_tt(value: float, depth: int) -> float:
+        """
+        Inverse of _value_to_tt.
+
+        Args:
+            value (float): Value read from the transposition table.
+            depth (int): Number of plies from the root to the state.
+
+        Returns:
+            float: The value with win and loss distances counted from the root.
+        """
+        if value > WIN_SCORE / 2:
+            return value - depth
+        if value < -WIN_SCORE / 2:
+            return value + depth
+        return value
+
+    def _hash_state(self, state: GameStateHex) -> int:
+        """
+        Zobrist hash of the board of a state.
+
+        Args:
+            state (GameStateHex): The state to hash.
+
+        Returns:
+            int: XOR of the Zobrist keys of every piece on the board.
+        """
+        dim = state.get_rep().get_dimensions()[0]
+        if dim != self._zobrist_dim:
+            self._zobrist = {t: [random.getrandbits(64) for _ in range(dim * dim)] for t in ("R", "B")}
+            self._zobrist_dim = dim
+            self._tt.clear()
+            self._state_hash.clear()
+        entry = self._state_hash.get(id(state))
+        if entry is not None and entry[0]() is state:
+            return entry[1]
+        h = 0
+        for (i, j), piece in state.get_rep().get_env().items():
+            h ^= self._zobrist[piece.get_type()][i * dim + j]
+        self._state_hash[id(state)] = (weakref.ref(state), h)
+        return h
+
+    def _next(self, state: GameStateHex, action: Action) -> GameStateHex:
+        """
+        Apply an action, deriving the Zobrist hash of the next state from the hash of state.
+
+        The weak reference stored with the hash tells apart a later state that reuses the id of a
+        freed one.
+
+        Args:
+            state (GameStateHex): The state where the action is played.
+            action (Action): The light action to apply.
+
+        Returns:
+            GameStateHex: The next state.
+        """
+        h = self._hash_state(state)
+        next_state = state.apply_action(action)
+        i, j = action.data["position"]
+        h ^= self._zobrist[action.data["piece"]][i * self._zobrist_dim + j]
+        self._state_hash[id(next_state)] = (weakref.ref(next_state), h)
+        return next_state
+
+    def terminal_value(self, state: GameStateHex, depth: int) -> float:
+        """
+        Value of a finished game, preferring the quickest wins and the slowest losses.
+
+        Args:
+            state (GameStateHex): A finished game state.
+            depth (int): Number of plies played from the root to reach state.
+
+        Returns:
+            float: WIN_SCORE if we won, -WIN_SCORE if we lost, shifted by depth.
+        """
+        for player in state.get_players():
+            if state.get_scores()[player.get_id()] == 1:
+                if player.get_piece_type() == self.piece_type:
+                    return WIN_SCORE - depth
+                return -WIN_SCORE + depth
+        return 0.0
+
+    def fast_heuristic(self, state: GameStateHex) -> float:
+        """
+        Cheap evaluation rewarding central pieces and pieces advanced towards the player's goal edge.
+
+        Args:
+            state (GameStateHex): The state to evaluate.
+
+        Returns:
+            float: Our score minus the opponent's score.
+        """
+        return self._board_heuristic(self._board_to_array(state))
+
+    def heuristic(self, state: GameStateHex) -> float:
+        """
+        Evaluation of the states at the horizon: the accurate heuristic, refined by the fast heuristic.
+
+        The accurate heuristic counts 10 per cell of distance, more than the fast heuristic changes
+        with a move, so connectivity decides and the fast heuristic orders the positions of equal distances.
+
+        Args:
+            state (GameStateHex): The state to evaluate.
+
+        Returns:
+            float: Positive if the state is good for us.
+        """
+        board = self._board_to_array(state)
+        my_dist = self.shortest_path_distance(board, self.piece_type)
+        opp_dist = self.shortest_path_distance(board, self._opponent_piece_type())
+        return self._board_heuristic(board) + self._distance_score(my_dist, opp_dist)
+
+    def _best_child_heuristic(self, state: GameStateHex, maximizing_player: bool,
+                              depth: int) -> tuple[float, Action] | None:
+        """
+        Best heuristic among the next states of state, evaluated on board arrays without building them.
+
+        fast_heuristic is a sum over the pieces, so playing a cell only adds that cell's weight to the
+        value of state. The distances of the next states are computed in one batch, a distance of 0 for
+        the mover being a win.
+
+        Args:
+            state (GameStateHex): A state one ply before the horizon.
+            maximizing_player (bool): True if it is our turn to play in state.
+            depth (int): Number of plies already played from the root.
+
+        Returns:
+            tuple[float, Action] | None: The best value and the action reaching it, None if no cell is empty.
+        """
+        board = self._board_to_array(state)
+        rows, cols = np.nonzero(board == 0)
+        if len(rows) == 0:
+            return None
+        piece_type = self.piece_type if maximizing_player else self._opponent_piece_type()
+        my_dist, opp_dist = self._child_distances(board, rows, cols, 1 if maximizing_player else -1)
+        weights = self._get_luts(board.shape[0])[piece_type][rows * board.shape[1] + cols]
+        values = self._distance_score(my_dist, opp_dist) + self._board_heuristic(board)
+        if maximizing_player:
+            values = np.where(my_dist == 0, WIN_SCORE - depth - 1, values + weights)
+            k = int(np.argmax(values))
+        else:
+            values = np.where(opp_dist == 0, -WIN_SCORE + depth + 1, values - weights)
+            k = int(np.argmin(values))
+        action = LightAction({"piece": piece_type, "position": (int(rows[k]), int(cols[k]))})
+        return float(values[k]), action
+
+    def _board_heuristic(self, board: np.ndarray) -> float:
+        """
+        fast_heuristic of a board array.
+
+        Args:
+            board (np.ndarray): Board as returned by _board_to_array.
+
+        Returns:
+            float: Our score minus the opponent's score.
+        """
+        luts = self._get_luts(board.shape[0])
+        flat = board.ravel()
+        return float(luts[self.piece_type] @ (flat == 1) - luts[self._opponent_piece_type()] @ (flat == -1))
+
+    def _opponent_piece_type(self) -> str:
+        """
+        Piece type of the opponent.
+
+        Returns:
+            str: "B" if we play "R", "R" otherwise.
+        """
+        return "B" if self.piece_type == "R" else "R"
+
+    def _board_to_array(self, state: GameStateHex) -> np.ndarray:
+        """
+        Board of a state as an array.
+
+        Args:
+            state (GameStateHex): The state to convert.
+
+        Returns:
+            np.ndarray: int8 array of shape (dim, dim), 1 for our pieces, -1 for the opponent's and 0 for empty cells.
+        """
+        dim = state.get_rep().get_dimensions()[0]
+        board = np.zeros((dim, dim), dtype=np.int8)
+        for (i, j), piece in state.get_rep().get_env().items():
+            board[i, j] = 1 if piece.get_type() == self.piece_type else -1
+        return board
+
+    def _get_luts(self, dim: int) -> dict[str, np.ndarray]:
+        """
+        Heuristic lookup tables of a board dimension, computed the first time the dimension is seen.
+
+        Args:
+            dim (int): Dimension of the board.
+
+        Returns:
+            dict[str, np.ndarray]: float32 tables of shape (dim, dim) "center" (center value) and "progR",
+                "progB" (progress towards the goal edge of each piece type), and flattened tables "R" and
+                "B" of the weight of a piece of each type on each cell i * dim + j.
+        """
+        luts = self._lut_cache.get(dim)
+        if luts is None:
+            i, j = np.indices((dim, dim))
+            center = (dim - 1) / 2.0
+            luts = {
+                "center": (2.0 / (1.0 + (np.abs(i - center) + np.abs(j - center)) * 0.1)).astype(np.float32),
+                "progR": (i / (dim - 1)).astype(np.float32),
+                "progB": (j / (dim - 1)).astype(np.float32),
+            }
+            luts["R"] = (luts["center"] + luts["progR"] * 2).ravel()
+            luts["B"] = (luts["center"] + luts["progB"] * 2).ravel()
+            self._lut_cache[dim] = luts
+        return luts
+
+    def accurate_heuristic(self, state: GameStateHex) -> float:
+        """
+        Evaluation comparing how many cells each player still needs to connect its edges.
 
-        #TODO
-        raise MethodNotImplementedError()
+        Args:
+            state (GameStateHex): The state to evaluate.
+
+        Returns:
+            float: Positive if we are closer to connecting our edges than the opponent.
+        """
+        opp_piece_type = self._opponent_piece_type()
+        board = self._board_to_array(state)
+        my_dist = self.shortest_path_distance(board, self.piece_type)
+        opp_dist = self.shortest_path_distance(board, opp_piece_type)
+        return self._distance_score(my_dist, opp_dist)
+
+    @staticmethod
+    def _distance_score(my_dist: int | np.ndarray, opp_dist: int | np.ndarray) -> int | np.ndarray:
+        """
+        Accurate heuristic of shortest connection lengths, elementwise for arrays of them.
+
+        Args:
+            my_dist (int | np.ndarray): Our shortest connection length.
+            opp_dist (int | np.ndarray): The opponent's shortest connection length.
+
+        Returns:
+            int | np.ndarray: Positive if we are closer to connecting our edges than the opponent.
+        """
+        return (opp_dist - my_dist) * 10
+
+    def shortest_path_distance(self, board: np.ndarray, piece_type: str) -> int:
+        """
+        Number of empty cells piece_type must still fill to connect its two edges.
+
+        Args:
+            board (np.ndarray): Board as returned by _board_to_array.
+            piece_type (str): "R" to connect the top and bottom edges, "B" for the left and right ones.
+
+        Returns:
+            int: Length of the shortest connection, dim * dim if the opponent already blocks every path.
+        """
+        piece_code = 1 if piece_type == self.piece_type else -1
+        if piece_type == "B":
+            # The hex adjacency is symmetric, so B's left-right connection is R's top-bottom one on the transpose
+            board = np.ascontiguousarray(board.T)
+        return int(_dijkstra_hex(board, piece_code, self._neighbour_table(board.shape[0])))
+
+    def _neighbour_table(self, dim: int) -> np.ndarray:
+        """
+        Coordinates of the neighbours of every cell, computed once per board dimension.
+
+        Args:
+            dim (int): Dimension of the board.
+
+        Returns:
+            np.ndarray: int16 array of shape (dim, dim, 6, 2), (-1, -1) for the neighbours outside the board.
+        """
+        table = self._neighbours.get(dim)
+        if table is None:
+            i, j = np.indices((dim, dim))
+            table = np.full((dim, dim, 6, 2), -1, dtype=np.int16)
+            for k, (di, dj) in enumerate(HEX_NEIGHBOUR_OFFSETS):
+                ni, nj = i + di, j + dj
+                inside = (ni >= 0) & (nj >= 0) & (ni < dim) & (nj < dim)
+                table[:, :, k, 0] = np.where(inside, ni, -1)
+                table[:, :, k, 1] = np.where(inside, nj, -1)
+            self._neighbours[dim] = table
+        return table
+
+    def ordered_root_actions(self, state: GameStateHex) -> list[Action]:
+        """
+        Possible actions of the root, the most promising first according to the accurate heuristic.
+
+        The boards after each action are built directly from the root board and evaluated in one batch.
+
+        Args:
+            state (GameStateHex): The root state, where we are to play.
+
+        Returns:
+            list[Action]: The possible actions, sorted by decreasing accurate heuristic of their next state.
+        """
+        actions = list(state.get_possible_light_actions())
+        rows, cols = zip(*(action.data["position"] for action in actions))
+        my_dist, opp_dist = self._child_distances(self._board_to_array(state), rows, cols, 1)
+        values = self._distance_score(my_dist, opp_dist)
+        return [actions[k] for k in np.argsort(-values, kind="stable")]
+
+    def _child_distances(self, board: np.ndarray, rows: Sequence[int], cols: Sequence[int],
+                         piece_code: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Shortest connection lengths of both players after each of a set of moves, computed in one batch.
+
+        Args:
+            board (np.ndarray): Board as returned by _board_to_array.
+            rows (Sequence[int]): Row of each move, on an empty cell.
+            cols (Sequence[int]): Column of each move.
+            piece_code (int): 1 if we play the moves, -1 if the opponent does.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: int32 arrays of our lengths and of the opponent's after each move.
+        """
+        boards = np.repeat(board[np.newaxis], len(rows), axis=0)
+        boards[np.arange(len(rows)), rows, cols] = piece_code
+        my_dist = self._batch_shortest_path_distance(boards, self.piece_type)
+        opp_dist = self._batch_shortest_path_distance(boards, self._opponent_piece_type())
+        return my_dist, opp_dist
+
+    def _batch_shortest_path_distance(self, boards: np.ndarray, piece_type: str) -> np.ndarray:
+        """
+        shortest_path_distance of each board of a stack.
+
+        Args:
+            boards (np.ndarray): int8 array of shape (N, dim, dim) of boards as returned by _board_to_array.
+            piece_type (str): "R" to connect the top and bottom edges, "B" for the left and right ones.
+
+        Returns:
+            np.ndarray: int32 array of the N shortest connection lengths.
+        """
+        piece_code = 1 if piece_type == self.piece_type else -1
+        if piece_type == "B":
+            boards = np.ascontiguousarray(boards.transpose(0, 2, 1))
+        return _batch_dijkstra(boards, piece_code, self._neighbour_table(boards.shape[1]))